@@ -1,9 +1,26 @@
+import asyncio
+import functools
+import io
+import json
 import shutil
+import time
 import kagglehub
 import pandas as pd
 import os
 import requests
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+
+# Hoisted so hot callers don't rebuild the tuple on every invocation
+_HTTP_PREFIXES = ("http://", "https://")
+
+# One shared session so repeated downloads reuse kept-alive connections
+# instead of paying the TCP+TLS handshake every call
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
 
 
 def unzip_file(zip_path, extract_dir=None):
@@ -43,15 +60,99 @@ def unzip_file(zip_path, extract_dir=None):
 
     os.makedirs(extract_dir, exist_ok=True)
 
-    # Extract files
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_dir)
+        members = zip_ref.infolist()
+
+    # Validate paths and create directories up front, so workers only inflate.
+    # Resolve the extraction root once; each entry then needs just a single
+    # prefix check to rule out zip-slip (entries like "../../evil")
+    root = os.path.realpath(extract_dir)
+    prefix = root + os.sep
+    for info in members:
+        target = os.path.realpath(os.path.join(root, info.filename))
+        if target != root and not target.startswith(prefix):
+            raise ValueError(f"Unsafe path in ZIP archive: {info.filename}")
+
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(target) or root, exist_ok=True)
+
+    files = [info for info in members if not info.is_dir()]
+
+    if len(files) < 4:
+        # Not worth spinning up threads for a handful of members
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for info in files:
+                _extract_member(zip_ref, info, extract_dir)
+    else:
+        # zlib releases the GIL while inflating, so threads give real parallelism.
+        # ZipFile is not thread-safe on a shared handle → one handle per worker task.
+        def extract_one(info):
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                _extract_member(zip_ref, info, extract_dir)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(extract_one, files))
 
     print(f"✅ Extracted '{zip_path}' → '{extract_dir}'")
 
     return extract_dir
 
 
+def _extract_member(zip_ref, info, extract_dir):
+    """Stream a single archive member to disk in 1 MiB blocks."""
+    target = os.path.join(extract_dir, info.filename)
+    with zip_ref.open(info) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+
+def _find_file(src_path, filename=None):
+    """
+    Resolve a file under a source path (file or directory) without copying it.
+    Searches recursively if the source is a directory; if filename is given,
+    that file is located, otherwise the first file found wins.
+    """
+    if not os.path.exists(src_path):
+        raise FileNotFoundError(f"Source path not found: {src_path}")
+
+    # If src_path is a single file
+    if os.path.isfile(src_path):
+        if filename and os.path.basename(src_path) != filename:
+            raise FileNotFoundError(f"Specified file '{filename}' not found at {src_path}")
+        return src_path
+
+    found_file = None
+
+    # Known filename: try it at the top level first — one syscall beats
+    # walking the whole tree, and Kaggle datasets usually land flat
+    if filename:
+        direct = os.path.join(src_path, filename)
+        if os.path.isfile(direct):
+            found_file = direct
+
+    # Otherwise search recursively with os.scandir, which hands back
+    # cached file-type info without a stat call per entry, and stop as
+    # soon as a match turns up
+    stack = [] if found_file else [src_path]
+    while stack and not found_file:
+        directory = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and (filename is None or entry.name == filename):
+                    found_file = entry.path
+                    break
+
+    if not found_file:
+        if filename:
+            raise FileNotFoundError(f"File '{filename}' not found under {src_path}")
+        else:
+            raise FileNotFoundError(f"No files found under {src_path}")
+    return found_file
+
+
 def move_to_project(src_path, target_dir, filename=None):
     """
     Move a file from a source path (file or directory) to a target directory.
@@ -77,61 +178,292 @@ def move_to_project(src_path, target_dir, filename=None):
     FileNotFoundError
         If the source file/directory does not exist, or if the specified filename is not found.
     """
-    if not os.path.exists(src_path):
-        raise FileNotFoundError(f"Source path not found: {src_path}")
-
-    # If src_path is a single file
-    if os.path.isfile(src_path):
-        src_file = src_path
-        if filename and os.path.basename(src_file) != filename:
-            raise FileNotFoundError(f"Specified file '{filename}' not found at {src_path}")
-    else:
-        # src_path is a directory → walk recursively
-        found_file = None
-        for root, dirs, files in os.walk(src_path):
-            if filename:
-                if filename in files:
-                    found_file = os.path.join(root, filename)
-                    break
-            else:
-                if files:
-                    found_file = os.path.join(root, files[0])
-                    break
-
-        if not found_file:
-            if filename:
-                raise FileNotFoundError(f"File '{filename}' not found under {src_path}")
-            else:
-                raise FileNotFoundError(f"No files found under {src_path}")
-        src_file = found_file
+    src_file = _find_file(src_path, filename=filename)
 
     # Ensure target directory exists
     os.makedirs(target_dir, exist_ok=True)
     dest_file = os.path.join(target_dir, os.path.basename(src_file))
 
-    shutil.copy(src_file, dest_file)
+    # Source already at the destination (same path or hardlinked): removing
+    # it to "overwrite" would delete the only copy, so just hand it back
+    if os.path.exists(dest_file) and os.path.samefile(src_file, dest_file):
+        print(f"✅ '{src_file}' is already at '{dest_file}'")
+        return dest_file
+
+    try:
+        # Same filesystem → hardlink: instant, zero bytes copied, and the
+        # source (e.g. the kagglehub cache) keeps its copy too
+        if os.path.exists(dest_file):
+            os.remove(dest_file)  # overwrite, like the copy always did
+        os.link(src_file, dest_file)
+    except OSError:
+        # Cross-device, link exists, or FS without hardlinks → copyfile,
+        # which skips the permission-bit copy of shutil.copy and uses the
+        # kernel's zero-copy path (sendfile/copy_file_range) where available
+        shutil.copyfile(src_file, dest_file)
     print(f"✅ Moved '{src_file}' → '{dest_file}'")
     return dest_file
 
 
-def file_to_df(file_path):
+# Above this size the multithreaded PyArrow CSV parser beats the default
+# engine; below it, parser startup dominates and the default engine wins
+_PYARROW_THRESHOLD = 50 * 1024 * 1024
+
+
+def _read_csv_file(file_path, **read_kwargs):
+    """Read a CSV from disk, using the PyArrow engine for large files."""
+    if os.path.getsize(file_path) > _PYARROW_THRESHOLD:
+        try:
+            return pd.read_csv(file_path, engine='pyarrow', **read_kwargs)
+        except ImportError:
+            pass  # pyarrow not installed → default engine
+    return pd.read_csv(file_path, **read_kwargs)
+
+
+def _read_excel_file(file_path, **read_kwargs):
+    """Read an Excel file, preferring the Rust-backed calamine engine."""
+    try:
+        return pd.read_excel(file_path, engine='calamine', **read_kwargs)
+    except ImportError:
+        return pd.read_excel(file_path, **read_kwargs)  # python-calamine not installed
+
+
+def _optimize_dtypes(df):
+    """
+    Shrink a freshly-loaded DataFrame: low-cardinality string columns become
+    category (one code per row instead of a pointer per cell) and integer
+    columns are downcast to the narrowest type that fits. Floats are left
+    alone — downcasting to float32 perturbs values (0.1 != float32(0.1)),
+    which is not acceptable in an analysis repo. Note that assigning a value
+    a category column hasn't seen raises; keep optimize_dtypes off for
+    frames you fill or relabel in place.
+    """
+    for col in df.select_dtypes(include='object').columns:
+        if df[col].nunique(dropna=False) / max(len(df), 1) < 0.5:
+            df[col] = df[col].astype('category')
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def file_to_df(file_path, chunksize=None, optimize_dtypes=True, backend='pandas', **read_kwargs):
     """
     Read a CSV or Excel file into a pandas DataFrame.
+
+    Large CSVs (>50 MB) are parsed with the multithreaded PyArrow engine
+    when pyarrow is installed.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the .csv/.xls/.xlsx file.
+    chunksize : int, optional
+        If set, return an iterator of DataFrames with up to chunksize rows
+        each instead of one big DataFrame, so huge files can be processed
+        piece by piece. For Excel files this iterates per sheet instead.
+    optimize_dtypes : bool, optional
+        If True (default), downcast the loaded table after parsing: team,
+        player and venue style columns become category and integer columns
+        shrink to the narrowest fitting type, cutting memory several-fold.
+        Pass False when you plan to assign new values into string columns
+        in place — category columns reject values they haven't seen.
+    backend : str, optional
+        'pandas' (default) or 'polars'. The polars backend parses CSVs with
+        one thread per core into Arrow-layout columns — typically several
+        times faster on big files — and returns a polars.DataFrame (call
+        .to_pandas() if you need pandas). Requires the polars package;
+        chunksize and optimize_dtypes only apply to the pandas backend.
+    **read_kwargs
+        Forwarded to pd.read_csv / pd.read_excel — pass dtype, usecols,
+        parse_dates etc. so pandas can skip type inference and allocate
+        narrow columns. For the PSL ball-by-ball schema something like
+        {'over': 'int8', 'ball': 'int8', 'runs': 'int8'} cuts memory a lot.
     """
     ext = os.path.splitext(file_path)[1].lower()
+
+    if backend == 'polars':
+        import polars as pl  # optional dependency, only needed for this backend
+        if ext == ".csv":
+            return pl.read_csv(file_path, rechunk=False, **read_kwargs)
+        elif ext in [".xls", ".xlsx", ".xlsb"]:
+            return pl.read_excel(file_path, **read_kwargs)
+        else:
+            raise ValueError(f"Unsupported file type: {ext}")
+    elif backend != 'pandas':
+        raise ValueError(f"Unsupported backend: {backend}")
+
     if ext == ".csv":
-        return pd.read_csv(file_path)
-    elif ext in [".xls", ".xlsx"]:
-        return pd.read_excel(file_path)
+        if chunksize:
+            return pd.read_csv(file_path, chunksize=chunksize, **read_kwargs)
+        df = _read_csv_file(file_path, **read_kwargs)
+    elif ext in [".xls", ".xlsx", ".xlsb"]:
+        if chunksize:
+            return iter(_read_excel_file(file_path, sheet_name=None, **read_kwargs).values())
+        df = _read_excel_file(file_path, **read_kwargs)
     else:
         raise ValueError(f"Unsupported file type: {ext}")
 
+    return _optimize_dtypes(df) if optimize_dtypes else df
+
+
+def zip_csv_to_df(zip_path, member=None, **read_kwargs):
+    """
+    Read a CSV straight out of a ZIP archive into a pandas DataFrame.
+
+    Skips unzip_file entirely: the member decompresses through a 1 MiB
+    buffered reader directly into the parser, so nothing extracted ever
+    touches disk.
 
-def read_kaggle_dataset(url, target=os.path.join(os.getcwd(), "data"), filename=None):
+    Parameters
+    ----------
+    zip_path : str
+        Path to the .zip file.
+    member : str, optional
+        Name of the CSV inside the archive. If omitted, the archive must
+        contain exactly one CSV, which is used.
+    **read_kwargs
+        Forwarded to pd.read_csv.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The dataframe containing the csv contents.
+    """
+    with zipfile.ZipFile(zip_path) as zf:
+        if member is None:
+            csvs = [name for name in zf.namelist() if name.lower().endswith(".csv")]
+            if len(csvs) != 1:
+                raise ValueError(f"Archive holds {len(csvs)} CSV files — pass 'member' to pick one")
+            member = csvs[0]
+        with zf.open(member) as f:
+            return pd.read_csv(io.BufferedReader(f, buffer_size=1024 * 1024), **read_kwargs)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_file_cached(file_path, mtime, optimize_dtypes):
+    return file_to_df(file_path, optimize_dtypes=optimize_dtypes)
+
+
+def _file_to_df_cached(file_path, mtime, optimize_dtypes=False):
+    """
+    file_to_df memoized on (path, mtime) so unchanged files parse once.
+    Hands out a copy of the cached frame: the notebook edits loaded frames
+    in place, and aliasing the cached object would poison later hits.
+    """
+    return _parse_file_cached(file_path, mtime, optimize_dtypes).copy()
+
+
+def csv_to_df(path_or_url, target=os.path.join(os.getcwd(), "data"), cache=True, chunksize=None,
+              **read_kwargs):
+    """
+    Read a CSV into a pandas DataFrame from a local path or a direct URL.
+
+    URLs are downloaded into "target" (streamed in 1 MiB chunks so memory
+    stays bounded no matter how large the file is) and then read from disk.
+    With cache=False nothing is written at all: pandas parses the response
+    stream directly, skipping the write+read round trip.
+
+    Parameters
+    ----------
+    path_or_url : str
+        Path to a local CSV file, or an http(s) URL pointing at one.
+    target : str, optional
+        Path within project directory to store a downloaded csv (default is "data").
+    cache : bool, optional
+        If True (default), keep a copy of the downloaded file on disk.
+        If False, parse straight from the HTTP response without touching disk.
+    chunksize : int, optional
+        If set, return an iterator of DataFrames with up to chunksize rows
+        each instead of one big DataFrame. URLs are always cached to disk
+        first in this mode so the iterator can outlive the connection.
+    **read_kwargs
+        Forwarded to pd.read_csv — pass dtype, usecols, parse_dates etc.
+        to skip type inference and keep columns narrow.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The dataframe containing the csv contents.
+
+    Raises
+    ------
+    FileNotFoundError
+        If a local path is given but no file exists there.
+    requests.HTTPError
+        If the download fails.
+    """
+    if not path_or_url.startswith(_HTTP_PREFIXES):
+        if not os.path.isfile(path_or_url):
+            raise FileNotFoundError(f"No file found at: {path_or_url}")
+        if chunksize:
+            return pd.read_csv(path_or_url, chunksize=chunksize, **read_kwargs)
+        return _read_csv_file(path_or_url, **read_kwargs)
+
+    if not cache and chunksize is None:
+        # Feed the socket straight into the pandas parser — no disk round-trip
+        with _SESSION.get(path_or_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return pd.read_csv(response.raw, **read_kwargs)
+
+    os.makedirs(target, exist_ok=True)
+    filename = os.path.basename(urlparse(path_or_url).path) or "download.csv"
+    local_path = os.path.join(target, filename)
+    meta_path = local_path + ".meta.json"
+
+    # If we already have the file plus its validators, ask the server whether
+    # it changed — a 304 costs a few hundred bytes instead of the whole body
+    headers = {}
+    if os.path.isfile(local_path) and os.path.isfile(meta_path):
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    with _SESSION.get(path_or_url, stream=True, timeout=30, headers=headers) as response:
+        if response.status_code == 304:
+            print(f"✅ Using cached '{local_path}' (server says unchanged)")
+            if chunksize:
+                return pd.read_csv(local_path, chunksize=chunksize, **read_kwargs)
+            return _read_csv_file(local_path, **read_kwargs)
+        response.raise_for_status()
+
+        # Stream the body straight to disk instead of buffering it all in memory
+        with open(local_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                f.write(chunk)
+
+        # Persist validators next to the file for the next call
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_length": response.headers.get("Content-Length"),
+        }
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f)
+
+    print(f"✅ Downloaded '{path_or_url}' → '{local_path}'")
+    if chunksize:
+        return pd.read_csv(local_path, chunksize=chunksize, **read_kwargs)
+    return _read_csv_file(local_path, **read_kwargs)
+
+
+def read_kaggle_dataset(url, target=os.path.join(os.getcwd(), "data"), filename=None,
+                        force_refresh=False, cache_ttl=24 * 60 * 60, copy_to_project=True,
+                        optimize_dtypes=False):
     """
     Take a URL ("url") of a Kaggle dataset, download the csv into its own folder (specified by "target") in the
     project, and read it into a Pandas DataFrame.
 
+    Repeat calls are cheap: if a fresh local copy already exists the Kaggle
+    download is skipped, and parsing is memoized on the file's mtime so
+    re-running a notebook cell costs nothing.
+
     Parameters
     ---------
     url: str
@@ -140,13 +472,76 @@ def read_kaggle_dataset(url, target=os.path.join(os.getcwd(), "data"), filename=
         Path within project directory to store downloaded csv (default is "data")
     filename: str, optional
         Name of the specific file to read from the dataset. If none is provided, the first file found will be picked
+    force_refresh: bool, optional
+        If True, always re-download from Kaggle even when a local copy exists
+    cache_ttl: int, optional
+        How long (seconds) a local copy counts as fresh (default 24 hours)
+    copy_to_project: bool, optional
+        If False, read straight from the kagglehub cache without duplicating
+        the file into "target" — saves a full write+read for read-only use
+    optimize_dtypes: bool, optional
+        If True, downcast string/integer columns after parsing (see
+        file_to_df). Off by default here because the notebook assigns new
+        values into loaded columns, which category dtypes reject
 
     Returns
     ------
     pandas.DataFrame
         The dataframe containing the csv contents.
     """
+    # Reuse a fresh local copy instead of asking Kaggle again — but only if
+    # it actually came from this dataset: Kaggle filenames like matches.csv
+    # are generic, so the sidecar records which url produced the file
+    if filename and not force_refresh:
+        local = os.path.join(target, filename)
+        if os.path.isfile(local) and time.time() - os.path.getmtime(local) < cache_ttl:
+            try:
+                with open(local + ".meta.json") as f:
+                    cached_url = json.load(f).get("url")
+            except (OSError, ValueError):
+                cached_url = None  # unknown origin → re-download
+            if cached_url == url:
+                print(f"✅ Using cached '{local}'")
+                return _file_to_df_cached(local, os.path.getmtime(local), optimize_dtypes)
+
     path = kagglehub.dataset_download(url)
+
+    if not copy_to_project:
+        src_file = _find_file(path, filename=filename)
+        print(f"Reading {src_file} straight from the kagglehub cache")
+        if src_file.lower().endswith(".zip"):
+            # Single-CSV zip in the cache → parse in-archive, no extraction
+            return zip_csv_to_df(src_file)
+        return _file_to_df_cached(src_file, os.path.getmtime(src_file), optimize_dtypes)
+
     dest_file = move_to_project(path, target, filename=filename)
+
+    # Remember which dataset this file came from, for the cache check above
+    with open(dest_file + ".meta.json", 'w') as f:
+        json.dump({"url": url}, f)
+
     print(f"Downloaded and read {dest_file}")
-    return file_to_df(dest_file)
+    return _file_to_df_cached(dest_file, os.path.getmtime(dest_file), optimize_dtypes)
+
+
+async def read_kaggle_dataset_async(url, **kwargs):
+    """
+    Async version of read_kaggle_dataset for loading several datasets at once.
+
+    kagglehub drives its own blocking HTTP transport, so each call runs in a
+    worker thread via asyncio.to_thread. The win is overlap: gather a handful
+    of these and the downloads, unzips and parses for different datasets
+    proceed concurrently instead of back to back.
+
+    Example
+    -------
+    >>> async def load_all():
+    ...     return await asyncio.gather(
+    ...         read_kaggle_dataset_async("user/matches"),
+    ...         read_kaggle_dataset_async("user/deliveries"),
+    ...     )
+    >>> matches, deliveries = asyncio.run(load_all())
+
+    Accepts the same keyword arguments as read_kaggle_dataset.
+    """
+    return await asyncio.to_thread(read_kaggle_dataset, url, **kwargs)